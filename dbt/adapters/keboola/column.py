@@ -1,8 +1,56 @@
 from dataclasses import dataclass
-from typing import ClassVar, Dict, Optional
+from types import MappingProxyType
+from typing import ClassVar, Dict, FrozenSet, Mapping, Optional, Tuple
 
 from dbt.adapters.base.column import Column
 
+# Snowflake type aliases mapped to their standardized names. Module-level
+# so the column hot path doesn't go through a class lookup; a plain dict,
+# as it is also Column.TYPE_LABELS. Callers only read it.
+_TYPE_LABELS: Dict[str, str] = {
+    "STRING": "VARCHAR",
+    "TEXT": "VARCHAR",
+    "BINARY": "BINARY",
+    "VARBINARY": "VARBINARY",
+    "INTEGER": "NUMBER",
+    "INT": "NUMBER",
+    "BIGINT": "NUMBER",
+    "SMALLINT": "NUMBER",
+    "TINYINT": "NUMBER",
+    "BYTEINT": "NUMBER",
+    "NUMERIC": "NUMBER",
+    "DECIMAL": "NUMBER",
+    "NUMBER": "NUMBER",
+    "FLOAT": "FLOAT",
+    "FLOAT4": "FLOAT",
+    "FLOAT8": "FLOAT",
+    "DOUBLE": "FLOAT",
+    "DOUBLE PRECISION": "FLOAT",
+    "REAL": "FLOAT",
+    "BOOLEAN": "BOOLEAN",
+    "DATE": "DATE",
+    "DATETIME": "TIMESTAMP_NTZ",
+    "TIME": "TIME",
+    "TIMESTAMP": "TIMESTAMP_NTZ",
+    "TIMESTAMP_NTZ": "TIMESTAMP_NTZ",
+    "TIMESTAMP_LTZ": "TIMESTAMP_LTZ",
+    "TIMESTAMP_TZ": "TIMESTAMP_TZ",
+    "VARIANT": "VARIANT",
+    "OBJECT": "OBJECT",
+    "ARRAY": "ARRAY",
+    "GEOGRAPHY": "GEOGRAPHY",
+    "GEOMETRY": "GEOMETRY",
+}
+
+# numeric_type templates for NUMBER aliases, keyed by
+# (precision given, scale given)
+_NUMBER_TYPE_TEMPLATES: Mapping[Tuple[bool, bool], str] = MappingProxyType({
+    (True, True): "NUMBER({precision},{scale})",
+    (True, False): "NUMBER({precision})",
+    (False, True): "NUMBER",
+    (False, False): "NUMBER",
+})
+
 
 @dataclass
 class KeboolaColumn(Column):
@@ -11,63 +59,61 @@ class KeboolaColumn(Column):
     Snowflake-based type system since Keboola uses Snowflake backend.
     """
 
-    TYPE_LABELS: ClassVar[Dict[str, str]] = {
-        "STRING": "VARCHAR",
-        "TEXT": "VARCHAR",
-        "BINARY": "BINARY",
-        "VARBINARY": "VARBINARY",
-        "INTEGER": "NUMBER",
-        "INT": "NUMBER",
-        "BIGINT": "NUMBER",
-        "SMALLINT": "NUMBER",
-        "TINYINT": "NUMBER",
-        "BYTEINT": "NUMBER",
-        "NUMERIC": "NUMBER",
-        "DECIMAL": "NUMBER",
-        "NUMBER": "NUMBER",
-        "FLOAT": "FLOAT",
-        "FLOAT4": "FLOAT",
-        "FLOAT8": "FLOAT",
-        "DOUBLE": "FLOAT",
-        "DOUBLE PRECISION": "FLOAT",
-        "REAL": "FLOAT",
-        "BOOLEAN": "BOOLEAN",
-        "DATE": "DATE",
-        "DATETIME": "TIMESTAMP_NTZ",
-        "TIME": "TIME",
-        "TIMESTAMP": "TIMESTAMP_NTZ",
-        "TIMESTAMP_NTZ": "TIMESTAMP_NTZ",
-        "TIMESTAMP_LTZ": "TIMESTAMP_LTZ",
-        "TIMESTAMP_TZ": "TIMESTAMP_TZ",
-        "VARIANT": "VARIANT",
-        "OBJECT": "OBJECT",
-        "ARRAY": "ARRAY",
-        "GEOGRAPHY": "GEOGRAPHY",
-        "GEOMETRY": "GEOMETRY",
-    }
+    TYPE_LABELS: ClassVar[Dict[str, str]] = _TYPE_LABELS
+
+    _STRING_TYPES: ClassVar[FrozenSet[str]] = frozenset(
+        {"VARCHAR", "CHAR", "CHARACTER", "STRING", "TEXT"}
+    )
+    _INT_TYPES: ClassVar[FrozenSet[str]] = frozenset(
+        {"INT", "INTEGER", "BIGINT", "SMALLINT", "TINYINT", "BYTEINT"}
+    )
+    _NUMERIC_TYPES: ClassVar[FrozenSet[str]] = frozenset(
+        {"NUMBER", "NUMERIC", "DECIMAL"}
+    ) | _INT_TYPES
+    _FLOAT_TYPES: ClassVar[FrozenSet[str]] = frozenset(
+        {"FLOAT", "FLOAT4", "FLOAT8", "DOUBLE", "DOUBLE PRECISION", "REAL"}
+    )
+
+    def __post_init__(self) -> None:
+        """
+        Resolve the standardized data type and quoted name once.
+        Type checks run for every column during catalog generation,
+        so avoid re-uppercasing dtype on each call.
+        """
+        if self.dtype is None:
+            data_type = "VARCHAR"
+        else:
+            dtype_upper = self.dtype.upper()
+            data_type = _TYPE_LABELS.get(dtype_upper, dtype_upper)
+        self._data_type: str = data_type
+
+        self._quoted_name: str = '"' + self.column + '"'
+
+    @property
+    def quoted(self) -> str:
+        """Return the double-quoted column name."""
+        return self._quoted_name
 
     @property
     def data_type(self) -> str:
         """Return the standardized data type."""
-        if self.dtype is None:
-            return "VARCHAR"
-        return self.TYPE_LABELS.get(self.dtype.upper(), self.dtype.upper())
+        return self._data_type
 
     def is_string(self) -> bool:
         """Check if the column is a string type."""
-        return self.data_type.upper() in ("VARCHAR", "CHAR", "CHARACTER", "STRING", "TEXT")
+        return self._data_type in self._STRING_TYPES
 
     def is_numeric(self) -> bool:
         """Check if the column is a numeric type."""
-        return self.data_type.upper() in ("NUMBER", "NUMERIC", "DECIMAL", "INT", "INTEGER", "BIGINT", "SMALLINT", "TINYINT", "BYTEINT")
+        return self._data_type in self._NUMERIC_TYPES
 
     def is_integer(self) -> bool:
         """Check if the column is an integer type."""
-        return self.data_type.upper() in ("INT", "INTEGER", "BIGINT", "SMALLINT", "TINYINT", "BYTEINT")
+        return self._data_type in self._INT_TYPES
 
     def is_float(self) -> bool:
         """Check if the column is a float type."""
-        return self.data_type.upper() in ("FLOAT", "FLOAT4", "FLOAT8", "DOUBLE", "DOUBLE PRECISION", "REAL")
+        return self._data_type in self._FLOAT_TYPES
 
     def is_number(self) -> bool:
         """Check if the column is any numeric type (integer or float)."""
@@ -83,13 +129,11 @@ class KeboolaColumn(Column):
     @classmethod
     def numeric_type(cls, dtype: str, precision: Optional[int] = None, scale: Optional[int] = None) -> str:
         """Return the numeric type definition."""
-        if dtype.upper() in ("NUMBER", "NUMERIC", "DECIMAL"):
-            if precision and scale:
-                return f"NUMBER({precision},{scale})"
-            elif precision:
-                return f"NUMBER({precision})"
-            return "NUMBER"
-        return dtype.upper()
+        dtype_upper = dtype.upper()
+        if dtype_upper not in ("NUMBER", "NUMERIC", "DECIMAL"):
+            return dtype_upper
+        template = _NUMBER_TYPE_TEMPLATES[(bool(precision), bool(scale))]
+        return template.format(precision=precision, scale=scale)
 
     def __repr__(self) -> str:
         """Return a string representation of the column."""
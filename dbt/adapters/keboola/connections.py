@@ -6,11 +6,15 @@ providing DB-API 2.0 compatible interfaces over the Keboola Query Service REST A
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Any, Tuple, Dict
+from typing import Optional, List, Any, Tuple, Dict, Iterator, Union
 from contextlib import contextmanager
+import hashlib
 import logging
+import re
+import threading
 
 import agate
+import httpx
 from dbt.adapters.sql import SQLConnectionManager
 from dbt.adapters.contracts.connection import (
     Credentials,
@@ -28,8 +32,181 @@ from keboola_query_service.exceptions import (
     AuthenticationError,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see KeboolaCredentials.fast_json
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Rows requested per Query Service results page
+RESULT_PAGE_SIZE = 500
+
+# Query Service column types with an unambiguous agate type. Columns of
+# other types (dates, timestamps, semi-structured) are left to agate's
+# type inference.
+_AGATE_TYPES: Dict[str, agate.DataType] = {
+    "NUMBER": agate.Number(),
+    "FIXED": agate.Number(),
+    "DECIMAL": agate.Number(),
+    "NUMERIC": agate.Number(),
+    "INT": agate.Number(),
+    "INTEGER": agate.Number(),
+    "BIGINT": agate.Number(),
+    "SMALLINT": agate.Number(),
+    "TINYINT": agate.Number(),
+    "BYTEINT": agate.Number(),
+    "FLOAT": agate.Number(),
+    "FLOAT4": agate.Number(),
+    "FLOAT8": agate.Number(),
+    "DOUBLE": agate.Number(),
+    "DOUBLE PRECISION": agate.Number(),
+    "REAL": agate.Number(),
+    "TEXT": agate.Text(),
+    "VARCHAR": agate.Text(),
+    "CHAR": agate.Text(),
+    "CHARACTER": agate.Text(),
+    "STRING": agate.Text(),
+    "BOOLEAN": agate.Boolean(),
+}
+
+# SQL tokens for _is_readonly: whitespace, comments, string literals,
+# quoted identifiers, parentheses, commas, words, and any other character.
+_SQL_TOKEN_RE = re.compile(
+    r"\s+|--[^\n]*|/\*.*?\*/|'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|[(),]|\w+|.",
+    re.DOTALL,
+)
+
+# Leading keywords of statements that only read data. These are sent
+# without transactional wrapping. A WITH statement is read-only only if
+# its main clause, after the CTEs, is a SELECT.
+_READONLY_KEYWORDS = frozenset({"SELECT", "SHOW", "DESC", "DESCRIBE", "EXPLAIN"})
+
+# Query Service clients shared by all connections in the process, keyed by
+# (base_url, token hash, timeout, fast_json). dbt opens a connection per
+# thread and per node; reusing the client reuses its HTTP connection pool,
+# so new connections skip the TCP/TLS handshake. The SDK client wraps
+# httpx.Client, which is safe to use from multiple threads.
+_CLIENT_CACHE: Dict[Tuple[str, str, float, bool], Client] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _is_readonly(sql: str) -> bool:
+    """
+    Return True if the SQL is a single read-only query. A statement
+    followed by another one after `;` is never read-only.
+    """
+    readonly: Optional[bool] = None
+    in_with = False
+    depth = 0
+    after_cte = False
+    ended = False
+
+    for match in _SQL_TOKEN_RE.finditer(sql):
+        token = match.group()
+        if token[0].isspace() or token.startswith(("--", "/*")):
+            continue
+
+        if ended:
+            # another statement after `;`
+            return False
+        if token == ";":
+            ended = True
+            continue
+        if readonly is not None:
+            continue
+
+        if not in_with:
+            keyword = token.upper()
+            if keyword != "WITH":
+                readonly = keyword in _READONLY_KEYWORDS
+                continue
+            in_with = True
+            continue
+
+        # Inside WITH: skip the CTE definitions and find the main clause,
+        # the first top-level word after a closed CTE body
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+            after_cte = depth == 0
+        elif depth == 0:
+            if token == ",":
+                after_cte = False
+            elif after_cte:
+                keyword = token.upper()
+                if keyword != "AS":
+                    # not a column list followed by AS (...)
+                    readonly = keyword == "SELECT"
+                    continue
+                after_cte = False
+
+    return bool(readonly)
+
+
+def _use_fast_json(client: Client) -> None:
+    """
+    Decode Query Service responses with orjson (opt-in, see
+    KeboolaCredentials.fast_json).
+
+    The SDK has no JSON loader hook and decodes every response with
+    httpx's Response.json(), so this registers an httpx response hook that
+    replaces json() on each response with an orjson-based equivalent.
+    Without orjson (or if the SDK stops exposing its httpx client) the
+    stdlib decoder is used.
+    """
+    http_client = getattr(client, "_client", None)
+    if orjson is None:
+        logger.warning("fast_json is enabled but orjson is not installed")
+        return
+    if not isinstance(http_client, httpx.Client):
+        return
+
+    def _orjson_response(response: httpx.Response) -> None:
+        response.json = (  # type: ignore[method-assign]
+            lambda **kwargs: orjson.loads(response.content)
+        )
+
+    http_client.event_hooks["response"].append(_orjson_response)
+
+
+def _get_shared_client(
+    base_url: str, token: str, timeout: float, fast_json: bool = False
+) -> Client:
+    """
+    Return the process-wide Query Service client for these settings,
+    creating it on first use.
+    """
+    key = (base_url, hashlib.sha256(token.encode()).hexdigest(), timeout, fast_json)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = Client(
+                base_url=base_url,
+                token=token,
+                timeout=timeout,
+                connect_timeout=10.0,
+                max_retries=3,
+            )
+            if fast_json:
+                _use_fast_json(client)
+            _CLIENT_CACHE[key] = client
+        return client
+
+
+def _close_shared_clients() -> None:
+    """Close and forget all shared Query Service clients."""
+    with _CLIENT_CACHE_LOCK:
+        clients = list(_CLIENT_CACHE.values())
+        _CLIENT_CACHE.clear()
+
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Error closing Keboola client: {e}")
+
 
 @dataclass
 class KeboolaCredentials(Credentials):
@@ -44,6 +221,13 @@ class KeboolaCredentials(Credentials):
         branch_id: Keboola branch ID (default: "default" for production)
         host: Query Service API host (default: "query.keboola.com")
         timeout: Query execution timeout in seconds (default: 300)
+        max_batch_size: Max statements sent in one Query Service job by
+            adapter.execute_batch (default: 25)
+        fast_json: Decode Query Service responses with orjson, installed
+            by the fast-json extra (default: False). orjson decodes
+            integers outside the 64-bit range (e.g. large NUMBER(38,0)
+            values) as floats, losing precision, and rejects NaN and
+            Infinity, so only enable it when results have neither.
     """
 
     token: str = ""
@@ -51,6 +235,8 @@ class KeboolaCredentials(Credentials):
     branch_id: str = "default"
     host: str = "query.keboola.com"
     timeout: int = 300
+    max_batch_size: int = 25
+    fast_json: bool = False
 
     _ALIASES: dict = field(default_factory=lambda: {
         "project": "database",
@@ -92,6 +278,19 @@ class KeboolaCursor:
     of a traditional database connection.
     """
 
+    __slots__ = (
+        "_client",
+        "_workspace_id",
+        "_branch_id",
+        "_timeout",
+        "_result",
+        "_data",
+        "_position",
+        "_pages",
+        "_description",
+        "_last_query_id",
+    )
+
     def __init__(
         self,
         client: Client,
@@ -117,20 +316,35 @@ class KeboolaCursor:
         self._result: Optional[QueryResult] = None
         self._data: List[List[Any]] = []
         self._position = 0
+        # Result pages after the one in _data, downloaded on demand
+        self._pages: Optional[Iterator[List[List[Any]]]] = None
+        self._description: Optional[Tuple[Tuple, ...]] = None
         self._last_query_id: Optional[str] = None
 
     @property
-    def description(self) -> Optional[List[Tuple]]:
+    def columns(self) -> List[Column]:
+        """Return column metadata of the last query result."""
+        if not self._result:
+            return []
+        return self._result.columns
+
+    @property
+    def description(self) -> Optional[Tuple[Tuple, ...]]:
         """
         Return column descriptions.
 
-        Returns a list of 7-element tuples as per DB-API 2.0 spec:
+        Returns a sequence of 7-element tuples as per DB-API 2.0 spec:
         (name, type_code, display_size, internal_size, precision, scale, null_ok)
         """
-        if not self._result or not self._result.columns:
+        return self._description
+
+    @staticmethod
+    def _describe(result: Optional[QueryResult]) -> Optional[Tuple[Tuple, ...]]:
+        """Build the DB-API description of a query result."""
+        if not result or not result.columns:
             return None
 
-        return [
+        return tuple(
             (
                 col.name,
                 col.type,
@@ -140,8 +354,8 @@ class KeboolaCursor:
                 None,  # scale
                 col.nullable,
             )
-            for col in self._result.columns
-        ]
+            for col in result.columns
+        )
 
     @property
     def rowcount(self) -> int:
@@ -166,13 +380,19 @@ class KeboolaCursor:
             return None
         return self._result.message
 
-    def execute(self, sql: str, bindings: Optional[List[Any]] = None) -> None:
+    def execute(
+        self,
+        sql: str,
+        bindings: Optional[List[Any]] = None,
+        fetch: bool = True,
+    ) -> None:
         """
         Execute SQL query through Keboola Query Service.
 
         Args:
             sql: SQL statement to execute
             bindings: Optional query parameters (not currently supported)
+            fetch: Whether result rows will be fetched from the cursor
 
         Raises:
             DbtDatabaseError: If query execution fails
@@ -180,33 +400,104 @@ class KeboolaCursor:
         if bindings:
             logger.warning("Parameter bindings are not supported by Keboola Query Service")
 
-        try:
-            logger.debug(f"Executing query: {sql[:200]}...")
+        self.execute_batch([sql], fetch=fetch)
+
+    def execute_batch(self, statements: List[str], fetch: bool = True) -> List[QueryResult]:
+        """
+        Execute several SQL statements in a single Query Service job.
+
+        The statements are sent in one REST call instead of one call per
+        statement. Cursor state (rowcount, fetch*) reflects the last statement.
+
+        Rows of the last statement are downloaded page by page as they are
+        fetched from the cursor, so its QueryResult only holds the first
+        page; results of earlier statements are complete.
 
-            # Execute query through Keboola Query Service
-            results = self._client.execute_query(
+        With fetch=False the result rows are never downloaded: the job
+        status already carries row counts, so the per-statement results
+        requests are skipped and the returned results have no data. The
+        job status has no per-statement message either, so those results
+        have message=None and get_response reports "OK" instead of the
+        server's message (e.g. "Table T successfully created.").
+
+        Args:
+            statements: SQL statements to execute, in order
+            fetch: Whether result rows will be fetched from the cursor
+
+        Returns:
+            List of QueryResult, one per statement
+
+        Raises:
+            DbtDatabaseError: If query execution fails
+        """
+        with self._handle_errors():
+            for sql in statements:
+                logger.debug(f"Executing query: {sql[:200]}...")
+
+            # Execute query through Keboola Query Service. Jobs made only
+            # of read-only queries skip the server-side BEGIN/COMMIT.
+            job_id = self._client.submit_job(
                 branch_id=self._branch_id,
                 workspace_id=self._workspace_id,
-                statements=[sql],
-                transactional=True,
+                statements=list(statements),
+                transactional=not all(_is_readonly(sql) for sql in statements),
+            )
+            status = self._client.wait_for_job(
+                job_id,
                 max_wait_time=float(self._timeout),
             )
+            self._last_query_id = job_id
 
-            # Store first result (we only execute one statement at a time)
+            if fetch:
+                # First page of every statement; the rest is paged in below
+                results = [
+                    self._client.get_job_results(
+                        job_id, statement.id, page_size=RESULT_PAGE_SIZE
+                    )
+                    for statement in status.statements
+                ]
+            else:
+                results = [
+                    QueryResult(
+                        status=statement.status,
+                        rows_affected=statement.rows_affected,
+                        number_of_rows=statement.number_of_rows,
+                    )
+                    for statement in status.statements
+                ]
+
+            # Store last result so the cursor describes the final statement
             if results:
-                self._result = results[0]
+                self._result = results[-1]
                 self._data = self._result.data or []
                 self._position = 0
+                self._pages = None
+                self._description = self._describe(self._result)
+
+                if fetch:
+                    # Earlier statements are returned complete; the cursor's
+                    # own statement is streamed page by page as it is fetched
+                    for statement, result in zip(status.statements, results[:-1]):
+                        for page in self._iter_pages(job_id, statement.id, result):
+                            result.data.extend(page)
+                    self._pages = self._iter_pages(
+                        job_id, status.statements[-1].id, self._result
+                    )
 
                 logger.debug(
                     f"Query completed: {self.rowcount} rows, "
                     f"status: {self._result.status}"
                 )
             else:
-                self._result = None
-                self._data = []
-                self._position = 0
+                self._reset()
+
+            return results
 
+    @contextmanager
+    def _handle_errors(self):
+        """Translate Query Service SDK errors into dbt errors."""
+        try:
+            yield
         except AuthenticationError as e:
             raise DbtDatabaseError(f"Authentication failed: {e}") from e
         except JobTimeoutError as e:
@@ -215,9 +506,61 @@ class KeboolaCursor:
             raise DbtDatabaseError(f"Query execution failed: {e}") from e
         except QueryServiceError as e:
             raise DbtDatabaseError(f"Query service error: {e}") from e
+        except DbtDatabaseError:
+            # Already translated by a nested _handle_errors (result paging)
+            raise
         except Exception as e:
             raise DbtDatabaseError(f"Unexpected error executing query: {e}") from e
 
+    def _iter_pages(
+        self, job_id: str, statement_id: str, first_page: QueryResult
+    ) -> Iterator[List[List[Any]]]:
+        """
+        Yield the result pages that follow `first_page`, one request each.
+
+        Pages are only requested when iterated, so large results are not
+        downloaded up front and unread pages are never downloaded.
+        """
+        offset = len(first_page.data or [])
+        total = first_page.number_of_rows or 0
+        while offset < total:
+            with self._handle_errors():
+                page = self._client.get_job_results(
+                    job_id, statement_id, offset=offset, page_size=RESULT_PAGE_SIZE
+                )
+            if not page.data:
+                return
+            offset += len(page.data)
+            yield page.data
+
+    def _next_page(self) -> bool:
+        """
+        Replace the exhausted buffer with the next result page.
+
+        Returns:
+            True if a page was loaded, False if there are no more rows
+        """
+        if self._pages is None:
+            return False
+        for page in self._pages:
+            self._data = page
+            self._position = 0
+            return True
+        self._pages = None
+        return False
+
+    @staticmethod
+    def _to_rows(data: List[Any]) -> List[Tuple[Any, ...]]:
+        """
+        Convert SDK result rows to tuples.
+
+        Rows are kept as returned by the SDK and only converted when
+        fetched, so rows that are never fetched are never copied.
+        """
+        if not data or type(data[0]) is tuple:
+            return data
+        return [tuple(row) for row in data]
+
     def fetchone(self) -> Optional[Tuple[Any, ...]]:
         """
         Fetch next row from query results.
@@ -225,12 +568,12 @@ class KeboolaCursor:
         Returns:
             Tuple containing row data, or None if no more rows
         """
-        if self._position >= len(self._data):
+        if self._position >= len(self._data) and not self._next_page():
             return None
 
-        row = tuple(self._data[self._position])
+        row = self._data[self._position]
         self._position += 1
-        return row
+        return row if type(row) is tuple else tuple(row)
 
     def fetchmany(self, size: int = 1) -> List[Tuple[Any, ...]]:
         """
@@ -242,9 +585,13 @@ class KeboolaCursor:
         Returns:
             List of tuples containing row data
         """
-        end_position = min(self._position + size, len(self._data))
-        rows = [tuple(row) for row in self._data[self._position:end_position]]
-        self._position = end_position
+        rows: List[Tuple[Any, ...]] = []
+        while len(rows) < size:
+            if self._position >= len(self._data) and not self._next_page():
+                break
+            end_position = min(self._position + size - len(rows), len(self._data))
+            rows.extend(self._to_rows(self._data[self._position:end_position]))
+            self._position = end_position
         return rows
 
     def fetchall(self) -> List[Tuple[Any, ...]]:
@@ -254,15 +601,24 @@ class KeboolaCursor:
         Returns:
             List of tuples containing row data
         """
-        rows = [tuple(row) for row in self._data[self._position:]]
+        rows = list(self._to_rows(self._data[self._position:]))
         self._position = len(self._data)
+        for page in self._pages or ():
+            rows.extend(self._to_rows(page))
+        self._pages = None
         return rows
 
     def close(self) -> None:
         """Close the cursor and clean up resources."""
+        self._reset()
+
+    def _reset(self) -> None:
+        """Drop the state of the last query so the cursor can be reused."""
         self._result = None
         self._data = []
         self._position = 0
+        self._pages = None
+        self._description = None
 
 
 class KeboolaConnectionHandle:
@@ -279,6 +635,7 @@ class KeboolaConnectionHandle:
         workspace_id: str,
         branch_id: str,
         timeout: int = 300,
+        max_batch_size: int = 25,
     ):
         """
         Initialize connection handle.
@@ -288,26 +645,39 @@ class KeboolaConnectionHandle:
             workspace_id: Keboola workspace ID
             branch_id: Keboola branch ID
             timeout: Query timeout in seconds
+            max_batch_size: Max statements sent in one batched job
         """
         self._client = client
         self.workspace_id = workspace_id
         self.branch_id = branch_id
         self.timeout = timeout
+        self.max_batch_size = max_batch_size
         self._in_transaction = False
 
+        # Reused by every cursor() call; handles are per thread, and dbt
+        # runs one statement at a time per connection
+        self._cursor: Optional[KeboolaCursor] = None
+
     def cursor(self) -> KeboolaCursor:
         """
-        Create a new cursor for executing queries.
+        Return the connection's cursor for executing queries.
+
+        The cursor is created on first use and reset on later calls,
+        instead of building a new one per statement.
 
         Returns:
             KeboolaCursor instance
         """
-        return KeboolaCursor(
-            client=self._client,
-            workspace_id=self.workspace_id,
-            branch_id=self.branch_id,
-            timeout=self.timeout,
-        )
+        if self._cursor is None:
+            self._cursor = KeboolaCursor(
+                client=self._client,
+                workspace_id=self.workspace_id,
+                branch_id=self.branch_id,
+                timeout=self.timeout,
+            )
+        else:
+            self._cursor._reset()
+        return self._cursor
 
     def begin(self) -> None:
         """Begin a transaction (no-op for Keboola REST API)."""
@@ -325,11 +695,12 @@ class KeboolaConnectionHandle:
         logger.debug("Transaction rolled back (simulated)")
 
     def close(self) -> None:
-        """Close the connection and clean up resources."""
-        try:
-            self._client.close()
-        except Exception as e:
-            logger.warning(f"Error closing Keboola client: {e}")
+        """
+        Close the connection and clean up resources.
+
+        The client is shared with other connections and stays open;
+        KeboolaConnectionManager.cleanup_all closes it at the end of the run.
+        """
 
 
 class KeboolaConnectionManager(SQLConnectionManager):
@@ -401,13 +772,12 @@ class KeboolaConnectionManager(SQLConnectionManager):
                 f"branch={credentials.branch_id}"
             )
 
-            # Create Keboola Query Service client
-            client = Client(
+            # Reuse the process-wide Keboola Query Service client
+            client = _get_shared_client(
                 base_url=base_url,
                 token=credentials.token,
                 timeout=float(credentials.timeout),
-                connect_timeout=10.0,
-                max_retries=3,
+                fast_json=credentials.fast_json,
             )
 
             # Create connection handle
@@ -416,6 +786,7 @@ class KeboolaConnectionManager(SQLConnectionManager):
                 workspace_id=credentials.workspace_id,
                 branch_id=credentials.branch_id,
                 timeout=credentials.timeout,
+                max_batch_size=credentials.max_batch_size,
             )
 
             connection.handle = handle
@@ -435,6 +806,11 @@ class KeboolaConnectionManager(SQLConnectionManager):
 
         return connection
 
+    def cleanup_all(self) -> None:
+        """Close all connections, then the shared Query Service clients."""
+        super().cleanup_all()
+        _close_shared_clients()
+
     def cancel(self, connection: Connection) -> None:
         """
         Cancel any running queries on this connection.
@@ -465,6 +841,36 @@ class KeboolaConnectionManager(SQLConnectionManager):
         if connection.handle:
             connection.handle.rollback()
 
+    def execute_batch(self, sql_list: Union[str, List[str]]) -> AdapterResponse:
+        """
+        Execute statements whose results are not needed (hooks, DDL chains)
+        in as few Query Service jobs as possible, `max_batch_size`
+        statements per job, instead of one REST round-trip per statement.
+
+        Args:
+            sql_list: SQL statements to execute, in order. A single string
+                is executed as one statement.
+
+        Returns:
+            AdapterResponse for the last statement
+        """
+        if isinstance(sql_list, str):
+            sql_list = [sql_list]
+        if not sql_list:
+            return AdapterResponse(_message="OK", rows_affected=0)
+
+        connection = self.get_thread_connection()
+        handle = connection.handle
+        batch_size = max(handle.max_batch_size, 1)
+
+        cursor = handle.cursor()
+        try:
+            for start in range(0, len(sql_list), batch_size):
+                cursor.execute_batch(sql_list[start:start + batch_size], fetch=False)
+            return self.get_response(cursor)
+        finally:
+            cursor.close()
+
     def get_response(self, cursor: KeboolaCursor) -> AdapterResponse:
         """
         Get adapter response from cursor.
@@ -506,10 +912,11 @@ class KeboolaConnectionManager(SQLConnectionManager):
         cursor = connection.handle.cursor()
 
         try:
-            # Execute query
-            cursor.execute(sql)
+            # Execute query; rows are only downloaded when they will be fetched
+            cursor.execute(sql, fetch=fetch)
 
-            # Get response
+            # Get response; without fetch the message is always "OK",
+            # see KeboolaCursor.execute_batch
             response = self.get_response(cursor)
 
             # Fetch results if requested
@@ -538,14 +945,45 @@ class KeboolaConnectionManager(SQLConnectionManager):
         """
         # Get column names and types from cursor description
         if cursor.description:
-            column_names = [col[0] for col in cursor.description]
-            rows = cursor.fetchall()
-            if limit is not None:
-                rows = rows[:limit]
+            # Deduplicate up front, as agate.Table would, so that types
+            # forced by name below refer to the same columns
+            column_names = agate.utils.deduplicate(
+                [col[0] for col in cursor.description], column_names=True
+            )
+            column_types = self._get_agate_column_types(cursor.columns, column_names)
+            rows = cursor.fetchall() if limit is None else cursor.fetchmany(limit)
         else:
             column_names = []
+            column_types = None
             rows = []
 
-        # Create agate table
-        # Note: agate will auto-detect column types from the data
-        return agate.Table(rows=rows, column_names=column_names)
+        return agate.Table(rows=rows, column_names=column_names, column_types=column_types)
+
+    @staticmethod
+    def _get_agate_column_types(columns: List[Column], column_names: List[str]) -> Any:
+        """
+        Build agate column types from Query Service column metadata.
+
+        Known types are passed to agate directly, so it does not have to
+        infer them cell by cell. If some types are unknown, only those
+        columns are inferred.
+
+        Args:
+            columns: Column metadata from the query result
+            column_names: Deduplicated table column names, one per column
+
+        Returns:
+            List of agate types, or a TypeTester forcing the known ones
+        """
+        types = [
+            _AGATE_TYPES.get((col.type or "").split("(", 1)[0].strip().upper())
+            for col in columns
+        ]
+
+        if None not in types:
+            return types
+        return agate.TypeTester(force={
+            name: agate_type
+            for name, agate_type in zip(column_names, types)
+            if agate_type is not None
+        })
@@ -1,18 +1,42 @@
-from typing import Optional, List, Set, Any, Dict
+from functools import lru_cache
+from typing import Optional, List, Any, Dict, FrozenSet, Tuple, Union, cast
 import logging
-import agate
+import threading
 
 from dbt.adapters.sql import SQLAdapter
+from dbt_common.record import auto_record_function
 
 logger = logging.getLogger(__name__)
 from dbt.adapters.base.meta import available
 from dbt.adapters.base import AdapterConfig
 from dbt.adapters.base.relation import BaseRelation
+from dbt.adapters.contracts.connection import AdapterResponse
+from dbt.adapters.capability import (
+    Capability,
+    CapabilityDict,
+    CapabilitySupport,
+    Support,
+)
 
 from dbt.adapters.keboola.connections import KeboolaConnectionManager
 from dbt.adapters.keboola.relation import KeboolaRelation
 from dbt.adapters.keboola.column import KeboolaColumn
 
+# string_add_sql templates by location
+_STRING_ADD_TEMPLATES: Dict[str, str] = {
+    "append": "{add_to} || '{value}'",
+    "prepend": "'{value}' || {add_to}",
+}
+
+
+@lru_cache(maxsize=4096)
+def _quote(identifier: str) -> str:
+    """
+    Double-quote an identifier. Memoized, as DDL rendering quotes the
+    same relation and column names over and over.
+    """
+    return '"' + identifier + '"'
+
 
 class KeboolaAdapter(SQLAdapter):
     """
@@ -24,6 +48,77 @@ class KeboolaAdapter(SQLAdapter):
     Relation = KeboolaRelation
     Column = KeboolaColumn
 
+    connections: KeboolaConnectionManager
+
+    # get_catalog_by_relations runs keboola__get_catalog_relations, which
+    # selects only the requested relations; the full catalog path runs
+    # keboola__get_catalog once per database. Both return the same columns.
+    _capabilities = CapabilityDict(
+        {Capability.SchemaMetadataByRelations: CapabilitySupport(support=Support.Full)}
+    )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Results of read-only INFORMATION_SCHEMA macros for this run, keyed by
+        # (macro_name, frozenset(kwargs.items())). Evicted when DDL touches them.
+        self._introspection_cache: Dict[Tuple[str, FrozenSet[Tuple[str, Any]]], Any] = {}
+        self._introspection_lock = threading.Lock()
+
+    def _cached_macro(self, macro_name: str, kwargs: Dict[str, Any]) -> Any:
+        """
+        Execute an introspection macro, reusing the result of an
+        identical earlier call.
+
+        Entries live for the whole run (no TTL) and are only evicted by
+        this adapter's drop/truncate/rename/schema methods and the
+        cache_added/cache_dropped/cache_renamed hooks. DDL run directly
+        through statement() or run_query (hooks, or macros such as
+        alter_relation_add_remove_columns) is not seen, so cached
+        columns of a relation altered that way stay stale.
+        """
+        key = (macro_name, frozenset(kwargs.items()))
+        with self._introspection_lock:
+            if key in self._introspection_cache:
+                return self._introspection_cache[key]
+
+        result = self.execute_macro(macro_name, kwargs=kwargs)
+
+        with self._introspection_lock:
+            self._introspection_cache[key] = result
+        return result
+
+    def _evict_introspection(self, relation: Optional[BaseRelation]) -> None:
+        """
+        Drop cached introspection results that may describe the relation:
+        its own columns and the relation listing of its schema.
+        """
+        if relation is None:
+            return
+
+        schema = (relation.schema or "").upper()
+        identifier = relation.identifier.upper() if relation.identifier else None
+
+        with self._introspection_lock:
+            for key in list(self._introspection_cache):
+                _, kwargs = key
+                for _, value in kwargs:
+                    if not isinstance(value, BaseRelation):
+                        continue
+                    if (value.schema or "").upper() != schema:
+                        continue
+                    if (
+                        identifier is None
+                        or value.identifier is None
+                        or value.identifier.upper() == identifier
+                    ):
+                        del self._introspection_cache[key]
+                        break
+
+    def _clear_introspection(self) -> None:
+        """Drop all cached introspection results (schema-level DDL)."""
+        with self._introspection_lock:
+            self._introspection_cache.clear()
+
     @classmethod
     def date_function(cls) -> str:
         """
@@ -43,7 +138,34 @@ class KeboolaAdapter(SQLAdapter):
         """
         Quote an identifier using Snowflake-style double quotes.
         """
-        return f'"{identifier}"'
+        return _quote(identifier)
+
+    def _make_match(
+        self,
+        relations_list: List[BaseRelation],
+        database: str,
+        schema: str,
+        identifier: str,
+    ) -> List[BaseRelation]:
+        """
+        Find relations matching a get_relation() lookup in one pass
+        with KeboolaRelation.batch_match instead of calling matches()
+        per relation.
+        """
+        search = self._make_match_kwargs(database, schema, identifier)
+        # The cache only holds relations built by this adapter's Relation
+        relations = cast(List[KeboolaRelation], relations_list)
+        return cast(List[BaseRelation], self.Relation.batch_match(relations, **search))
+
+    @available
+    def execute_batch(self, sql_list: Union[str, List[str]]) -> AdapterResponse:
+        """
+        Run statements whose results are not needed in as few Query Service
+        jobs as possible (`max_batch_size` statements per job), e.g. from a
+        hook: {% do adapter.execute_batch([...]) %}. A single string is run
+        as one statement.
+        """
+        return self.connections.execute_batch(sql_list)
 
     @available
     def list_relations_without_caching(
@@ -58,7 +180,7 @@ class KeboolaAdapter(SQLAdapter):
         }
 
         try:
-            results = self.execute_macro(
+            results = self._cached_macro(
                 "list_relations_without_caching",
                 kwargs=kwargs,
             )
@@ -68,13 +190,9 @@ class KeboolaAdapter(SQLAdapter):
             )
             return []
 
+        # The macro selects exactly database, schema, name and type
         relations = []
-        for row in results:
-            if len(row) < 4:
-                continue
-
-            database, schema, identifier, relation_type = row[:4]
-
+        for database, schema, identifier, relation_type in results:
             relation = self.Relation.create(
                 database=database,
                 schema=schema,
@@ -92,8 +210,8 @@ class KeboolaAdapter(SQLAdapter):
         Queries INFORMATION_SCHEMA.COLUMNS.
         """
         try:
-            rows = self.execute_macro(
-                "get_columns_in_relation",
+            table = self._cached_macro(
+                "keboola__get_columns_in_relation_table",
                 kwargs={"relation": relation},
             )
         except Exception as e:
@@ -102,18 +220,30 @@ class KeboolaAdapter(SQLAdapter):
             )
             return []
 
-        columns = []
-        for row in rows:
-            column = KeboolaColumn(
-                column=row.column_name,
-                dtype=row.data_type,
-                char_size=getattr(row, 'character_maximum_length', None),
-                numeric_precision=getattr(row, 'numeric_precision', None),
-                numeric_scale=getattr(row, 'numeric_scale', None),
+        # Read whole columns instead of looking up attributes row by row
+        names = table.columns["column_name"].values()
+
+        def optional_values(column_name: str) -> Any:
+            if column_name in table.column_names:
+                return table.columns[column_name].values()
+            return [None] * len(names)
+
+        return [
+            KeboolaColumn(
+                column=name,
+                dtype=dtype,
+                char_size=char_size,
+                numeric_precision=precision,
+                numeric_scale=scale,
             )
-            columns.append(column)
-
-        return columns
+            for name, dtype, char_size, precision, scale in zip(
+                names,
+                table.columns["data_type"].values(),
+                optional_values("character_maximum_length"),
+                optional_values("numeric_precision"),
+                optional_values("numeric_scale"),
+            )
+        ]
 
     @available
     def drop_relation(self, relation: KeboolaRelation) -> None:
@@ -123,6 +253,7 @@ class KeboolaAdapter(SQLAdapter):
         if relation.type is None:
             relation = relation.incorporate(type="table")
 
+        self._evict_introspection(relation)
         self.execute_macro(
             "drop_relation",
             kwargs={"relation": relation},
@@ -133,6 +264,7 @@ class KeboolaAdapter(SQLAdapter):
         """
         Truncate a table.
         """
+        self._evict_introspection(relation)
         self.execute_macro(
             "truncate_relation",
             kwargs={"relation": relation},
@@ -145,6 +277,8 @@ class KeboolaAdapter(SQLAdapter):
         """
         Rename a relation.
         """
+        self._evict_introspection(from_relation)
+        self._evict_introspection(to_relation)
         self.execute_macro(
             "rename_relation",
             kwargs={
@@ -159,6 +293,7 @@ class KeboolaAdapter(SQLAdapter):
         Create a schema.
         """
         relation = relation.without_identifier()
+        self._clear_introspection()
         self.execute_macro(
             "create_schema",
             kwargs={"relation": relation},
@@ -170,6 +305,7 @@ class KeboolaAdapter(SQLAdapter):
         Drop a schema.
         """
         relation = relation.without_identifier()
+        self._clear_introspection()
         self.execute_macro(
             "drop_schema",
             kwargs={"relation": relation},
@@ -180,28 +316,66 @@ class KeboolaAdapter(SQLAdapter):
         """
         List all schemas in a database.
         """
-        results = self.execute_macro(
+        results = self._cached_macro(
             "list_schemas",
             kwargs={"database": database},
         )
 
-        schemas = []
-        for row in results:
-            schemas.append(row[0])
-
-        return schemas
+        return list(results.columns[0].values())
 
     @available
     def check_schema_exists(self, database: str, schema: str) -> bool:
         """
         Check if a schema exists.
         """
-        results = self.execute_macro(
+        information_schema = self.Relation.create(
+            database=database,
+            schema=schema,
+            identifier="INFORMATION_SCHEMA",
+            quote_policy=self.config.quoting,
+        ).information_schema()
+
+        results = self._cached_macro(
             "check_schema_exists",
-            kwargs={"database": database, "schema": schema},
+            kwargs={"information_schema": information_schema, "schema": schema},
         )
 
-        return len(results) > 0
+        # The macro returns a single count(*) row
+        return results[0][0] > 0
+
+    @auto_record_function("AdapterCacheAdded", group="Available")
+    @available
+    def cache_added(self, relation: Optional[BaseRelation]) -> str:
+        """
+        Register a relation created by a materialization.
+        Its columns may have changed, so evict cached introspection.
+        """
+        self._evict_introspection(relation)
+        return super().cache_added(relation)
+
+    @auto_record_function("AdapterCacheDropped", group="Available")
+    @available
+    def cache_dropped(self, relation: Optional[BaseRelation]) -> str:
+        """
+        Unregister a dropped relation and evict cached introspection.
+        """
+        self._evict_introspection(relation)
+        return super().cache_dropped(relation)
+
+    @auto_record_function("AdapterCacheRenamed", group="Available")
+    @available
+    def cache_renamed(
+        self,
+        from_relation: Optional[BaseRelation],
+        to_relation: Optional[BaseRelation],
+    ) -> str:
+        """
+        Rename a relation in the cache and evict cached introspection
+        for both names.
+        """
+        self._evict_introspection(from_relation)
+        self._evict_introspection(to_relation)
+        return super().cache_renamed(from_relation, to_relation)
 
     def timestamp_add_sql(self, add_to: str, number: int = 1, interval: str = "hour") -> str:
         """
@@ -219,50 +393,10 @@ class KeboolaAdapter(SQLAdapter):
         """
         Generate SQL for string concatenation.
         """
-        if location == "append":
-            return f"{add_to} || '{value}'"
-        elif location == "prepend":
-            return f"'{value}' || {add_to}"
-        else:
+        template = _STRING_ADD_TEMPLATES.get(location)
+        if template is None:
             raise ValueError(f"Invalid location: {location}")
-
-    @available
-    def get_catalog(self, manifest: Any) -> agate.Table:
-        """
-        Get catalog information for all relations.
-        """
-        schema_map = self._get_catalog_schemas(manifest)
-
-        if len(schema_map) > 1:
-            raise ValueError(
-                f"Expected exactly one schema in get_catalog, found {len(schema_map)}"
-            )
-
-        with self.connection_named("list_catalog"):
-            results = []
-            for info, schemas in schema_map.items():
-                for schema in schemas:
-                    relations = self.list_relations_without_caching(
-                        schema_relation=self.Relation.create(
-                            database=info.database,
-                            schema=schema,
-                        )
-                    )
-
-                    for relation in relations:
-                        columns = self.get_columns_in_relation(relation)
-                        for column in columns:
-                            results.append({
-                                "table_database": relation.database,
-                                "table_schema": relation.schema,
-                                "table_name": relation.identifier,
-                                "table_type": relation.type,
-                                "column_name": column.name,
-                                "column_index": column.index if hasattr(column, 'index') else None,
-                                "column_type": column.data_type,
-                            })
-
-            return agate.Table.from_object(results)
+        return template.format(add_to=add_to, value=value)
 
     @available
     def valid_snapshot_target(self, relation: KeboolaRelation) -> None:
@@ -277,8 +411,14 @@ class KeboolaAdapter(SQLAdapter):
     def standardize_grants_dict(self, grants_dict: Dict[str, List[str]]) -> Dict[str, List[str]]:
         """
         Standardize grant privileges for Snowflake.
+
+        Privilege lists that are already uppercase (as returned by
+        SHOW GRANTS) are reused instead of copied.
         """
         standardized = {}
         for grantee, privileges in grants_dict.items():
-            standardized[grantee] = [p.upper() for p in privileges]
+            if all(p.isupper() for p in privileges):
+                standardized[grantee] = privileges
+            else:
+                standardized[grantee] = [p.upper() for p in privileges]
         return standardized
@@ -1,9 +1,44 @@
+import sys
 from dataclasses import dataclass
-from typing import FrozenSet, Optional, Type
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from dbt.adapters.base.relation import BaseRelation, Policy
 from dbt.adapters.contracts.relation import ComponentName
 
+# Default relation policies, built once. Callers only read them.
+_DEFAULT_QUOTE_POLICY = Policy(
+    database=False,
+    schema=False,
+    identifier=True,
+)
+_DEFAULT_INCLUDE_POLICY = Policy(
+    database=True,
+    schema=True,
+    identifier=True,
+)
+
+
+@lru_cache(maxsize=4096)
+def _upper(name: str) -> str:
+    """
+    Upper-case a name. Relation names come from a small set, so memoized;
+    the result is interned so that comparing match keys of different
+    relations mostly comes down to identity checks.
+    """
+    return sys.intern(name.upper())
+
 
 @dataclass(frozen=True, eq=False, repr=False)
 class KeboolaRelation(BaseRelation):
@@ -13,25 +48,63 @@ class KeboolaRelation(BaseRelation):
     Case-insensitive matching like Snowflake.
     """
 
+    # Memoized values derived from the (frozen) fields. BaseRelation has no
+    # __slots__, so instances keep a __dict__ regardless; slotting the memos
+    # keeps them out of that dict, and out of __dict__-based copies.
+    __slots__ = ("_match_key_memo", "_upper_set_memo", "_render_memo")
+
+    if TYPE_CHECKING:
+        # Memo types for type checkers only. ClassVar keeps the dataclass
+        # machinery from treating them as fields; at runtime they are slots.
+        _match_key_memo: ClassVar[Tuple[Optional[str], Optional[str], Optional[str]]]
+        _upper_set_memo: ClassVar[FrozenSet[str]]
+        _render_memo: ClassVar[str]
+
     quote_character: str = '"'
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Leave the memo slots out of copies and pickles: restoring them
+        # would go through the frozen __setattr__, and they are recomputed
+        # on demand anyway.
+        return self.__dict__
+
+    @property
+    def _match_key(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Upper-cased (identifier, schema, database) for case-insensitive
+        matching. Relations are frozen, so this is computed once. The
+        identifier comes first because it is the part that usually
+        differs, so tuple comparisons stop on the first element.
+        """
+        try:
+            return self._match_key_memo
+        except AttributeError:
+            identifier, schema, database = (
+                None if part is None else _upper(part)
+                for part in (self.identifier, self.schema, self.database)
+            )
+            key = (identifier, schema, database)
+            object.__setattr__(self, "_match_key_memo", key)
+            return key
+
+    @property
+    def _upper_set(self) -> FrozenSet[str]:
+        """Non-empty upper-cased path components."""
+        try:
+            return self._upper_set_memo
+        except AttributeError:
+            upper_set = frozenset(filter(None, self._match_key))
+            object.__setattr__(self, "_upper_set_memo", upper_set)
+            return upper_set
+
     def _is_exactish_match(self, other: "KeboolaRelation") -> bool:
         """
         Case-insensitive comparison for Snowflake.
         """
         if other is None:
             return False
-        return (
-            self.database is not None
-            and other.database is not None
-            and self.database.upper() == other.database.upper()
-            and self.schema is not None
-            and other.schema is not None
-            and self.schema.upper() == other.schema.upper()
-            and self.identifier is not None
-            and other.identifier is not None
-            and self.identifier.upper() == other.identifier.upper()
-        )
+        key = self._match_key
+        return None not in key and key == other._match_key
 
     def matches(
         self,
@@ -41,34 +114,48 @@ class KeboolaRelation(BaseRelation):
     ) -> bool:
         """
         Case-insensitive matching for Snowflake-style identifiers.
+        A search without any parts matches nothing.
         """
-        search = filter(None, [database, schema, identifier])
-
-        if not any([self.database, self.schema, self.identifier]):
+        if not (database or schema or identifier):
             return False
 
-        for part in search:
-            part_upper = part.upper()
-            if self.database and self.database.upper() == part_upper:
-                continue
-            if self.schema and self.schema.upper() == part_upper:
-                continue
-            if self.identifier and self.identifier.upper() == part_upper:
-                continue
+        upper_set = self._upper_set
+        if not upper_set:
             return False
+
+        for part in (database, schema, identifier):
+            if part and _upper(part) not in upper_set:
+                return False
         return True
 
+    @classmethod
+    def batch_match(
+        cls,
+        relations: Iterable["KeboolaRelation"],
+        database: Optional[str] = None,
+        schema: Optional[str] = None,
+        identifier: Optional[str] = None,
+    ) -> List["KeboolaRelation"]:
+        """
+        Return the relations that matches() would accept for this search.
+        The search parts are upper-cased once for the whole list, and each
+        relation is checked with a single frozenset subset test.
+        """
+        search = frozenset(
+            _upper(part) for part in (database, schema, identifier) if part
+        )
+        if not search:
+            return []
+
+        return [relation for relation in relations if search <= relation._upper_set]
+
     @classmethod
     def get_default_quote_policy(cls) -> Policy:
         """
         Define the default quote policy for Keboola relations.
         Snowflake-style: quote identifiers, not database/schema.
         """
-        return Policy(
-            database=False,
-            schema=False,
-            identifier=True,
-        )
+        return _DEFAULT_QUOTE_POLICY
 
     @classmethod
     def get_default_include_policy(cls) -> Policy:
@@ -76,41 +163,43 @@ class KeboolaRelation(BaseRelation):
         Define the default include policy for Keboola relations.
         Include database, schema, and identifier in relation paths.
         """
-        return Policy(
-            database=True,
-            schema=True,
-            identifier=True,
-        )
+        return _DEFAULT_INCLUDE_POLICY
 
     def render(self) -> str:
         """
         Render the relation as a fully qualified name.
         Returns format like: database.schema."identifier"
-        """
-        parts = []
 
-        include_policy = self.include_policy or self.get_default_include_policy()
-        quote_policy = self.quote_policy or self.get_default_quote_policy()
-
-        if include_policy.database and self.database:
-            database = self.database
-            if quote_policy.database:
-                database = f'{self.quote_character}{database}{self.quote_character}'
-            parts.append(database)
-
-        if include_policy.schema and self.schema:
-            schema = self.schema
-            if quote_policy.schema:
-                schema = f'{self.quote_character}{schema}{self.quote_character}'
-            parts.append(schema)
-
-        if include_policy.identifier and self.identifier:
-            identifier = self.identifier
-            if quote_policy.identifier:
-                identifier = f'{self.quote_character}{identifier}{self.quote_character}'
-            parts.append(identifier)
-
-        return '.'.join(parts)
+        The path and policies of a relation never change, so the result
+        is computed once per instance; dbt renders (and hashes, which
+        renders) the same relation many times per run.
+        """
+        try:
+            return self._render_memo
+        except AttributeError:
+            rendered = self._render()
+            object.__setattr__(self, "_render_memo", rendered)
+            return rendered
+
+    def _render(self) -> str:
+        """Build the rendered name for render()."""
+        # database/schema/identifier are properties over self.path; read
+        # the path once and take the components from it directly
+        path = self.path
+        quote_character = self.quote_character
+        include_policy = self.include_policy or _DEFAULT_INCLUDE_POLICY
+        quote_policy = self.quote_policy or _DEFAULT_QUOTE_POLICY
+
+        components = (
+            (include_policy.database, quote_policy.database, path.database),
+            (include_policy.schema, quote_policy.schema, path.schema),
+            (include_policy.identifier, quote_policy.identifier, path.identifier),
+        )
+        return '.'.join(
+            quote_character + value + quote_character if quoted else value
+            for included, quoted, value in components
+            if included and value
+        )
 
     def quote(
         self,
@@ -121,14 +210,12 @@ class KeboolaRelation(BaseRelation):
         """
         Return a new relation with updated quote policy.
         """
-        quote_policy = self.quote_policy or self.get_default_quote_policy()
-
-        return self.replace(
-            quote_policy=quote_policy.replace(
-                database=database if database is not None else quote_policy.database,
-                schema=schema if schema is not None else quote_policy.schema,
-                identifier=identifier if identifier is not None else quote_policy.identifier,
-            )
+        return self._update_policy(
+            "quote_policy",
+            _DEFAULT_QUOTE_POLICY,
+            database=database,
+            schema=schema,
+            identifier=identifier,
         )
 
     def include(
@@ -140,12 +227,29 @@ class KeboolaRelation(BaseRelation):
         """
         Return a new relation with updated include policy.
         """
-        include_policy = self.include_policy or self.get_default_include_policy()
-
-        return self.replace(
-            include_policy=include_policy.replace(
-                database=database if database is not None else include_policy.database,
-                schema=schema if schema is not None else include_policy.schema,
-                identifier=identifier if identifier is not None else include_policy.identifier,
-            )
+        return self._update_policy(
+            "include_policy",
+            _DEFAULT_INCLUDE_POLICY,
+            database=database,
+            schema=schema,
+            identifier=identifier,
         )
+
+    def _update_policy(
+        self, attr: str, default: Policy, **overrides: Optional[bool]
+    ) -> "KeboolaRelation":
+        """
+        Return a relation whose quote or include policy (attr) has the
+        non-None overrides applied. Relations are immutable, so when no
+        override changes the policy the relation itself is returned.
+        """
+        policy = getattr(self, attr) or default
+        changes = {
+            part: value
+            for part, value in overrides.items()
+            if value is not None and value != getattr(policy, part)
+        }
+        if not changes:
+            return self
+
+        return self.replace(**{attr: policy.replace(**changes)})
@@ -66,6 +66,14 @@
 
 
 {% macro keboola__get_columns_in_relation(relation) -%}
+  {% set table = keboola__get_columns_in_relation_table(relation) %}
+  {{ return(sql_convert_columns_in_relation(table)) }}
+{%- endmacro %}
+
+
+{% macro keboola__get_columns_in_relation_table(relation) -%}
+  {# Raw INFORMATION_SCHEMA.COLUMNS rows; KeboolaAdapter.get_columns_in_relation
+     builds its columns from this table column by column #}
   {% call statement('get_columns_in_relation', fetch_result=True) %}
     select
       "column_name",
@@ -81,8 +89,7 @@
     order by "ordinal_position"
   {% endcall %}
 
-  {% set table = load_result('get_columns_in_relation').table %}
-  {{ return(sql_convert_columns_in_relation(table)) }}
+  {{ return(load_result('get_columns_in_relation').table) }}
 {%- endmacro %}
 
 
@@ -1,56 +1,64 @@
 {% macro keboola__get_catalog(information_schema, schemas) -%}
   {% set query %}
-    with tables as (
-      select
-        TABLE_CATALOG as table_database,
-        TABLE_SCHEMA,
-        TABLE_NAME,
-        TABLE_TYPE
-      from {{ information_schema }}.tables
-      where (
-        {%- for schema in schemas -%}
-          upper(TABLE_SCHEMA) = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
-        {%- endfor -%}
-      )
-    ),
-
-    columns as (
-      select
-        TABLE_CATALOG as table_database,
-        TABLE_SCHEMA,
-        TABLE_NAME,
-        COLUMN_NAME,
-        ORDINAL_POSITION as column_index,
-        DATA_TYPE as column_type
-      from {{ information_schema }}.columns
-      where (
-        {%- for schema in schemas -%}
-          upper(TABLE_SCHEMA) = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
-        {%- endfor -%}
-      )
+    {{ keboola__catalog_columns_sql(information_schema) }}
+    where (
+      {%- for schema in schemas -%}
+        upper(columns.TABLE_SCHEMA) = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
+      {%- endfor -%}
     )
-
-    select
-      columns.table_database,
+    order by
       columns.TABLE_SCHEMA,
       columns.TABLE_NAME,
-      tables.TABLE_TYPE,
-      columns.COLUMN_NAME,
-      columns.column_index,
-      columns.column_type
-    from tables
-    join columns
-      on tables.table_database = columns.table_database
-      and tables.TABLE_SCHEMA = columns.TABLE_SCHEMA
-      and tables.TABLE_NAME = columns.TABLE_NAME
+      columns.ORDINAL_POSITION
+  {% endset %}
+
+  {{ return(run_query(query)) }}
+{%- endmacro %}
+
+
+{% macro keboola__get_catalog_relations(information_schema, relations) -%}
+  {# Columns for all requested relations in a single INFORMATION_SCHEMA round-trip #}
+  {% set query %}
+    {{ keboola__catalog_columns_sql(information_schema) }}
+    where (
+      {%- for relation in relations -%}
+        (upper(columns.TABLE_SCHEMA) = upper('{{ relation.schema }}')
+        {%- if relation.identifier %} and upper(columns.TABLE_NAME) = upper('{{ relation.identifier }}'){% endif -%})
+        {%- if not loop.last %} or {% endif -%}
+      {%- endfor -%}
+    )
     order by
-      columns.column_index
+      columns.TABLE_SCHEMA,
+      columns.TABLE_NAME,
+      columns.ORDINAL_POSITION
   {% endset %}
 
   {{ return(run_query(query)) }}
 {%- endmacro %}
 
 
+{% macro keboola__catalog_columns_sql(information_schema) -%}
+  {# Shared select of both catalog macros, so they return identical columns #}
+    select
+      columns.TABLE_CATALOG as "table_database",
+      columns.TABLE_SCHEMA as "table_schema",
+      columns.TABLE_NAME as "table_name",
+      case
+        when tables.TABLE_TYPE = 'BASE TABLE' then 'table'
+        when tables.TABLE_TYPE = 'VIEW' then 'view'
+        else lower(tables.TABLE_TYPE)
+      end as "table_type",
+      columns.COLUMN_NAME as "column_name",
+      columns.ORDINAL_POSITION as "column_index",
+      columns.DATA_TYPE as "column_type"
+    from {{ information_schema }}.columns as columns
+    join {{ information_schema }}.tables as tables
+      on tables.TABLE_CATALOG = columns.TABLE_CATALOG
+      and tables.TABLE_SCHEMA = columns.TABLE_SCHEMA
+      and tables.TABLE_NAME = columns.TABLE_NAME
+{%- endmacro %}
+
+
 {% macro keboola__list_schemas(database) -%}
   {% set sql %}
     select SCHEMA_NAME
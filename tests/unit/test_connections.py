@@ -0,0 +1,313 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+import agate
+import pytest
+from dbt_common.exceptions import DbtDatabaseError
+from keboola_query_service import Column, QueryResult, StatementState
+from keboola_query_service.exceptions import QueryServiceError
+
+from dbt.adapters.keboola import connections
+from dbt.adapters.keboola.connections import (
+    KeboolaConnectionHandle,
+    KeboolaConnectionManager,
+    KeboolaCursor,
+    _is_readonly,
+)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "select 1",
+        "  -- comment\n/* block\n */ SELECT 1",
+        "show schemas",
+        "desc table t",
+        "describe table t",
+        "explain select 1",
+        "with x as (select 1) select * from x",
+        "with recursive x as (select 1) select * from x",
+        "with x (a, b) as (select 1, 2), y as (select ')' from x) select * from y",
+        "select 1;",
+        "select ';' from t; -- trailing comment",
+    ],
+)
+def test_is_readonly(sql):
+    assert _is_readonly(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "",
+        "create table t as select 1",
+        "insert into t select 1",
+        "selectx from t",
+        "(select 1)",
+        "with x as (select 1) insert into t select * from x",
+        "with x as (select '(' from t) delete from t",
+        'with x as (select "(" from t) merge into t using x on true',
+        "select 1; drop table t",
+        "select 1;\n/* next */ select 2",
+        "with x as (select 1) select * from x; delete from t",
+        "; select 1",
+    ],
+)
+def test_is_not_readonly(sql):
+    assert not _is_readonly(sql)
+
+
+class _DescribedCursor:
+    """Cursor stand-in for get_result_from_cursor."""
+
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.description = [(col.name,) for col in columns]
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+
+def _result_table(columns, rows):
+    manager = KeboolaConnectionManager.__new__(KeboolaConnectionManager)
+    return manager.get_result_from_cursor(_DescribedCursor(columns, rows))
+
+
+def test_result_types_follow_column_positions_with_duplicate_names():
+    columns = [
+        Column(name="A", type="NUMBER", nullable=True),
+        Column(name="A", type="TEXT", nullable=True),
+        Column(name="B", type="VARIANT", nullable=True),
+    ]
+
+    with pytest.warns(RuntimeWarning):
+        table = _result_table(columns, [(1, "x", "abc")])
+
+    assert table.column_names == ("A", "A_2", "B")
+    assert isinstance(table.column_types[0], agate.Number)
+    assert isinstance(table.column_types[1], agate.Text)
+    assert table.rows[0].values() == (Decimal(1), "x", "abc")
+
+
+def test_result_types_all_known():
+    columns = [
+        Column(name="N", type="NUMBER(38,0)", nullable=True),
+        Column(name="S", type="VARCHAR", nullable=True),
+    ]
+
+    table = _result_table(columns, [(1, "1")])
+
+    assert table.rows[0].values() == (Decimal(1), "1")
+
+
+class _StubClient:
+    """Query Service client stand-in serving one paged result per statement."""
+
+    def __init__(self, *results):
+        self._results = results
+        self.results_calls = []
+        self.submitted = []
+
+    def submit_job(self, branch_id, workspace_id, statements, transactional):
+        self.submitted.append((statements, transactional))
+        return "job-1"
+
+    def wait_for_job(self, job_id, max_wait_time):
+        return SimpleNamespace(
+            statements=[
+                SimpleNamespace(
+                    id=f"st-{index}",
+                    status=StatementState.COMPLETED,
+                    rows_affected=None,
+                    number_of_rows=len(rows),
+                )
+                for index, rows in enumerate(self._results)
+            ]
+        )
+
+    def get_job_results(self, job_id, statement_id, offset=0, page_size=100):
+        self.results_calls.append((statement_id, offset))
+        rows = self._results[int(statement_id.split("-")[1])]
+        return QueryResult(
+            status=StatementState.COMPLETED,
+            columns=[Column(name="N", type="NUMBER", nullable=True)],
+            data=[list(row) for row in rows[offset:offset + page_size]],
+            number_of_rows=len(rows),
+        )
+
+
+@pytest.fixture
+def small_pages(monkeypatch):
+    monkeypatch.setattr(connections, "RESULT_PAGE_SIZE", 2)
+
+
+def _rows(count):
+    return [(n,) for n in range(count)]
+
+
+def test_fetchall_reads_every_page(small_pages):
+    client = _StubClient(_rows(5))
+    cursor = KeboolaCursor(client, "ws", "branch")
+
+    cursor.execute("select n from t")
+
+    assert cursor.fetchall() == _rows(5)
+    assert client.results_calls == [("st-0", 0), ("st-0", 2), ("st-0", 4)]
+    assert client.submitted == [(["select n from t"], False)]
+
+
+def test_fetchmany_crosses_page_boundaries(small_pages):
+    client = _StubClient(_rows(5))
+    cursor = KeboolaCursor(client, "ws", "branch")
+
+    cursor.execute("select n from t")
+
+    assert cursor.fetchmany(3) == _rows(3)
+    assert cursor.fetchmany(3) == _rows(5)[3:]
+    assert cursor.fetchmany(3) == []
+
+
+def test_unread_pages_are_not_downloaded(small_pages):
+    client = _StubClient(_rows(5))
+    cursor = KeboolaCursor(client, "ws", "branch")
+
+    cursor.execute("select n from t")
+
+    assert cursor.fetchone() == (0,)
+    assert client.results_calls == [("st-0", 0)]
+
+
+def test_earlier_statements_are_fetched_complete(small_pages):
+    client = _StubClient(_rows(3), _rows(5))
+    cursor = KeboolaCursor(client, "ws", "branch")
+
+    results = cursor.execute_batch(["select 1", "select 2"])
+
+    assert [tuple(row) for row in results[0].data] == _rows(3)
+    assert cursor.fetchall() == _rows(5)
+
+
+def test_result_limit(small_pages):
+    client = _StubClient(_rows(5))
+    cursor = KeboolaCursor(client, "ws", "branch")
+    manager = KeboolaConnectionManager.__new__(KeboolaConnectionManager)
+
+    cursor.execute("select n from t")
+    table = manager.get_result_from_cursor(cursor, limit=3)
+
+    assert [row.values() for row in table.rows] == [(0,), (1,), (2,)]
+    assert client.results_calls == [("st-0", 0), ("st-0", 2)]
+
+
+def test_fetch_false_skips_results_requests():
+    client = _StubClient(_rows(5))
+    cursor = KeboolaCursor(client, "ws", "branch")
+
+    cursor.execute("insert into t select n from s", fetch=False)
+
+    assert client.results_calls == []
+    assert client.submitted == [(["insert into t select n from s"], True)]
+    assert cursor.rowcount == 5
+    assert cursor.fetchall() == []
+
+
+def _batch_manager(client, max_batch_size):
+    manager = KeboolaConnectionManager.__new__(KeboolaConnectionManager)
+    handle = KeboolaConnectionHandle(
+        client, "ws", "branch", max_batch_size=max_batch_size
+    )
+    manager.get_thread_connection = lambda: SimpleNamespace(handle=handle)
+    return manager
+
+
+def test_execute_batch_splits_by_max_batch_size():
+    client = _StubClient(_rows(1), _rows(1))
+    manager = _batch_manager(client, max_batch_size=2)
+
+    response = manager.execute_batch(["drop 1", "drop 2", "drop 3", "drop 4", "drop 5"])
+
+    assert [statements for statements, _ in client.submitted] == [
+        ["drop 1", "drop 2"],
+        ["drop 3", "drop 4"],
+        ["drop 5"],
+    ]
+    assert client.results_calls == []
+    assert response.rows_affected == 1
+
+
+def test_execute_batch_of_one_string():
+    client = _StubClient(_rows(1))
+    manager = _batch_manager(client, max_batch_size=25)
+
+    manager.execute_batch("drop table t")
+
+    assert client.submitted == [(["drop table t"], True)]
+
+
+def test_execute_batch_of_nothing():
+    client = _StubClient()
+    manager = _batch_manager(client, max_batch_size=25)
+
+    response = manager.execute_batch([])
+
+    assert client.submitted == []
+    assert response.rows_affected == 0
+
+
+@pytest.fixture
+def shared_clients():
+    yield
+    connections._close_shared_clients()
+
+
+def _response_hooks(client):
+    return client._client.event_hooks["response"]
+
+
+def test_stdlib_json_by_default(shared_clients):
+    client = connections._get_shared_client("https://query.test", "token", 1.0)
+
+    assert _response_hooks(client) == []
+
+
+def test_fast_json_is_opt_in(shared_clients):
+    pytest.importorskip("orjson")
+
+    client = connections._get_shared_client(
+        "https://query.test", "token", 1.0, fast_json=True
+    )
+
+    assert len(_response_hooks(client)) == 1
+    assert client is not connections._get_shared_client(
+        "https://query.test", "token", 1.0
+    )
+
+
+class _FailingPagesClient(_StubClient):
+    """Stub client whose results pages after the first one fail."""
+
+    def get_job_results(self, job_id, statement_id, offset=0, page_size=100):
+        if offset:
+            raise QueryServiceError("page gone")
+        return super().get_job_results(job_id, statement_id, offset, page_size)
+
+
+def test_paging_errors_are_not_wrapped_twice(small_pages):
+    cursor = KeboolaCursor(_FailingPagesClient(_rows(3), _rows(1)), "ws", "branch")
+
+    with pytest.raises(DbtDatabaseError) as excinfo:
+        cursor.execute_batch(["select 1", "select 2"])
+
+    assert str(excinfo.value).endswith("Query service error: page gone")
+    assert "Unexpected error" not in str(excinfo.value)
+
+
+def test_fetch_false_response_message():
+    manager = _batch_manager(_StubClient(_rows(2)), max_batch_size=25)
+
+    response, table = manager.execute("create table t as select 1")
+
+    assert response._message == "OK"
+    assert response.rows_affected == 2
+    assert len(table.rows) == 0
@@ -0,0 +1,131 @@
+import multiprocessing
+from types import SimpleNamespace
+
+import agate
+import pytest
+
+from dbt.adapters.keboola.impl import KeboolaAdapter
+from dbt.adapters.keboola.relation import KeboolaRelation
+
+
+@pytest.fixture
+def adapter():
+    config = SimpleNamespace(log_cache_events=False, quoting={})
+    adapter = KeboolaAdapter(config, multiprocessing.get_context("spawn"))
+    adapter.macro_calls = []
+    adapter.macro_kwargs = []
+    adapter.macro_results = {}
+
+    def execute_macro(macro_name, kwargs=None, **_):
+        adapter.macro_calls.append(macro_name)
+        adapter.macro_kwargs.append(kwargs)
+        if macro_name in adapter.macro_results:
+            return adapter.macro_results[macro_name]
+        if macro_name == "keboola__get_columns_in_relation_table":
+            return agate.Table(
+                rows=[("ID", "NUMBER", None, 38, 0)],
+                column_names=[
+                    "column_name",
+                    "data_type",
+                    "character_maximum_length",
+                    "numeric_precision",
+                    "numeric_scale",
+                ],
+            )
+        return None
+
+    adapter.execute_macro = execute_macro
+    return adapter
+
+
+def _relation(identifier):
+    return KeboolaRelation.create(database="DB", schema="S", identifier=identifier)
+
+
+def _column_queries(adapter):
+    return adapter.macro_calls.count("keboola__get_columns_in_relation_table")
+
+
+def test_columns_are_cached(adapter):
+    relation = _relation("T")
+
+    assert [c.name for c in adapter.get_columns_in_relation(relation)] == ["ID"]
+    adapter.get_columns_in_relation(relation)
+
+    assert _column_queries(adapter) == 1
+
+
+def test_drop_evicts_cached_columns(adapter):
+    relation = _relation("T")
+    other = _relation("OTHER")
+    adapter.get_columns_in_relation(relation)
+    adapter.get_columns_in_relation(other)
+
+    adapter.drop_relation(relation)
+    adapter.get_columns_in_relation(relation)
+    adapter.get_columns_in_relation(other)
+
+    assert _column_queries(adapter) == 3
+
+
+def test_rename_evicts_both_names(adapter):
+    old, new = _relation("OLD"), _relation("NEW")
+    adapter.get_columns_in_relation(old)
+    adapter.get_columns_in_relation(new)
+
+    adapter.rename_relation(old, new)
+    adapter.get_columns_in_relation(old)
+    adapter.get_columns_in_relation(new)
+
+    assert _column_queries(adapter) == 4
+
+
+@pytest.mark.parametrize("hook", ["cache_added", "cache_dropped"])
+def test_cache_hooks_evict_cached_columns(adapter, hook):
+    relation = _relation("T")
+    adapter.get_columns_in_relation(relation)
+
+    getattr(adapter, hook)(relation)
+    adapter.get_columns_in_relation(relation)
+
+    assert _column_queries(adapter) == 2
+
+
+def test_cache_renamed_evicts_cached_columns(adapter):
+    old, new = _relation("OLD"), _relation("NEW")
+    adapter.cache_added(old)
+    adapter.get_columns_in_relation(old)
+
+    adapter.cache_renamed(old, new)
+    adapter.get_columns_in_relation(old)
+
+    assert _column_queries(adapter) == 2
+
+
+@pytest.mark.parametrize("count, exists", [(1, True), (0, False)])
+def test_check_schema_exists(adapter, count, exists):
+    adapter.macro_results["check_schema_exists"] = agate.Table(
+        rows=[(count,)], column_names=["count"]
+    )
+
+    assert adapter.check_schema_exists("DB", "S") is exists
+
+    (kwargs,) = adapter.macro_kwargs
+    assert kwargs["schema"] == "S"
+    assert kwargs["information_schema"].database == "DB"
+
+
+def test_list_schemas(adapter):
+    adapter.macro_results["list_schemas"] = agate.Table(
+        rows=[("S",), ("OTHER",)], column_names=["SCHEMA_NAME"]
+    )
+
+    assert adapter.list_schemas("DB") == ["S", "OTHER"]
+
+
+def test_make_match_is_case_insensitive(adapter):
+    adapter.config.quoting = {"database": True, "schema": True, "identifier": True}
+    relations = [_relation("T"), _relation("OTHER")]
+
+    assert adapter._make_match(relations, "db", "s", "t") == relations[:1]
+    assert adapter._make_match(relations, None, None, None) == []
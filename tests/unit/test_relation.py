@@ -0,0 +1,127 @@
+import copy
+import pickle
+
+import pytest
+
+from dbt.adapters.keboola.relation import KeboolaRelation
+
+
+def _relation(database="DB", schema="SCHEMA", identifier="TABLE"):
+    return KeboolaRelation.create(
+        database=database, schema=schema, identifier=identifier
+    )
+
+
+@pytest.mark.parametrize(
+    "search, expected",
+    [
+        ({"database": "db", "schema": "schema", "identifier": "table"}, True),
+        ({"schema": "Schema", "identifier": "Table"}, True),
+        ({"identifier": "TABLE"}, True),
+        ({"identifier": "other"}, False),
+        ({"schema": "other", "identifier": "table"}, False),
+        ({"database": "other"}, False),
+        ({}, False),
+    ],
+)
+def test_matches_is_case_insensitive(search, expected):
+    relation = _relation()
+
+    assert relation.matches(**search) is expected
+    assert KeboolaRelation.batch_match([relation], **search) == (
+        [relation] if expected else []
+    )
+
+
+def test_batch_match_keeps_order_of_matching_relations():
+    relations = [_relation(identifier=name) for name in ("A", "B", "a")]
+
+    assert KeboolaRelation.batch_match(relations, identifier="a") == [
+        relations[0],
+        relations[2],
+    ]
+
+
+def test_relation_without_path_matches_nothing():
+    relation = KeboolaRelation.create()
+
+    assert not relation.matches(identifier="table")
+    assert KeboolaRelation.batch_match([relation], identifier="table") == []
+
+
+@pytest.mark.parametrize(
+    "other, expected",
+    [
+        (_relation("db", "schema", "table"), True),
+        (_relation("DB", "SCHEMA", "OTHER"), False),
+        (_relation("DB", "SCHEMA", None), False),
+        (None, False),
+    ],
+)
+def test_is_exactish_match_is_case_insensitive(other, expected):
+    assert _relation()._is_exactish_match(other) is expected
+
+
+def test_is_exactish_match_needs_full_path():
+    relation = _relation(identifier=None)
+
+    assert not relation._is_exactish_match(_relation(identifier=None))
+
+
+def test_render():
+    relation = _relation()
+
+    assert relation.render() == '"DB"."SCHEMA"."TABLE"'
+    assert str(relation) == '"DB"."SCHEMA"."TABLE"'
+
+
+def test_render_with_default_quote_policy():
+    relation = KeboolaRelation.create(
+        database="DB",
+        schema="SCHEMA",
+        identifier="TABLE",
+        quote_policy=KeboolaRelation.get_default_quote_policy(),
+    )
+
+    assert relation.render() == 'DB.SCHEMA."TABLE"'
+
+
+def test_render_of_quoted_and_included_copies():
+    relation = _relation()
+    relation.render()
+
+    assert relation.quote(database=False).render() == 'DB."SCHEMA"."TABLE"'
+    assert relation.quote(schema=False, identifier=False).render() == (
+        '"DB".SCHEMA.TABLE'
+    )
+    assert relation.include(database=False).render() == '"SCHEMA"."TABLE"'
+    assert relation.include(identifier=False).render() == '"DB"."SCHEMA"'
+    # the original keeps its own memoized rendering
+    assert relation.render() == '"DB"."SCHEMA"."TABLE"'
+
+
+def test_unchanged_policy_returns_same_relation():
+    relation = _relation()
+
+    assert relation.quote(identifier=True) is relation
+    assert relation.include(database=True) is relation
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda r: pickle.loads(pickle.dumps(r))],
+)
+def test_copies_of_memoized_relation(clone):
+    relation = _relation()
+    relation.render()
+    relation.matches(identifier="table")
+    assert relation._render_memo and relation._upper_set_memo
+
+    cloned = clone(relation)
+
+    assert cloned.render() == relation.render()
+    assert cloned.matches(identifier="table")
+    assert cloned._is_exactish_match(relation)
+    assert cloned.replace_path(identifier="other").render() == (
+        '"DB"."SCHEMA"."other"'
+    )